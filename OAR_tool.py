@@ -3,14 +3,20 @@ import tkinter as tk
 import customtkinter as ctk
 from tkinter import messagebox, filedialog
 import os
+import queue
 import shutil
+import sqlite3
+import threading
+import time
 import vdf
 import winreg
 import sys
+import struct
+import zlib
 from pathlib import Path
-from typing import Dict, Optional, List
+from typing import Dict, Optional, List, Set, Tuple
 import logging
-from dataclasses import dataclass
+from dataclasses import dataclass, field, replace
 
 
 ctk.set_appearance_mode("Dark")
@@ -23,6 +29,73 @@ class AccountInfo:
     steam64_id: Optional[str]
     userdata_path: str
     persona_name: str
+    source_root: str
+
+
+@dataclass(frozen=True)
+class FieldSpec:
+    key: str
+    label: str
+    save_type: str
+    property_path: str
+    encoding: str
+    replaces_file: bool = False
+    placeholder: Optional[bytes] = None
+    secure_path: Optional[str] = None
+
+    ENCODING_RANGES = {
+        "int32": (-2147483648, 2147483647),
+    }
+
+    def validate(self, value) -> Optional[str]:
+        minimum, maximum = self.ENCODING_RANGES[self.encoding]
+        if value < minimum:
+            return f"{self .key .capitalize ()} must be at least {minimum :,}"
+        if value > maximum:
+            return f"{self .key .capitalize ()} must be at most {maximum :,}"
+        return None
+
+
+@dataclass
+class PlannedWrite:
+    file_type: str
+    path: Path
+    contents: bytes
+
+
+@dataclass
+class ApplyPlan:
+    steam64_id: str
+    writes: List[PlannedWrite] = field(default_factory=list)
+    problems: List[str] = field(default_factory=list)
+
+    ESTIMATED_WRITE_RATE = 20 * 1024 * 1024
+    ESTIMATED_FILE_OVERHEAD = 0.01
+
+    @property
+    def total_bytes(self) -> int:
+        return sum(len(write.contents) for write in self.writes)
+
+    @property
+    def estimated_seconds(self) -> float:
+        return (
+            len(self.writes) * self.ESTIMATED_FILE_OVERHEAD
+            + self.total_bytes / self.ESTIMATED_WRITE_RATE
+        )
+
+    def describe(self) -> str:
+        lines = [f"Apply plan for Steam64 ID {self .steam64_id }:"]
+        for write in self.writes:
+            lines.append(
+                f"  [{write .file_type }] {write .path } ({len (write .contents ):,} bytes)"
+            )
+        lines.append(
+            f"{len (self .writes )} file(s), {self .total_bytes :,} bytes, "
+            f"~{self .estimated_seconds :.2f}s expected"
+        )
+        for problem in self.problems:
+            lines.append(f"  Problem: {problem }")
+        return "\n".join(lines)
 
 
 class CTkMenu(ctk.CTkToplevel):
@@ -82,10 +155,14 @@ class DebugConsole(ctk.CTkToplevel):
         self.title("Debug Console")
         self.geometry("1100x620")
 
+        self._pending_output: "queue.Queue[str]" = queue.Queue()
+        self._drain_job = None
+
         self._setup_icon()
         self._setup_ui()
         self._populate_history(log_history)
         self._attach_as_handler()
+        self._drain_pending_output()
 
     def _setup_icon(self):
         try:
@@ -114,27 +191,122 @@ class DebugConsole(ctk.CTkToplevel):
         logging.getLogger().addHandler(self.console_handler)
 
     def write(self, text):
-        if self.winfo_exists():
+        self._pending_output.put(text)
+
+    def _drain_pending_output(self):
+        chunks = []
+        while not self._pending_output.empty():
+            chunks.append(self._pending_output.get_nowait())
+
+        if chunks and self.winfo_exists():
             self.console_output.configure(state="normal")
-            self.console_output.insert(tk.END, text)
+            self.console_output.insert(tk.END, "".join(chunks))
             self.console_output.see(tk.END)
             self.console_output.configure(state="disabled")
 
+        self._drain_job = self.after(100, self._drain_pending_output)
+
     def flush(self):
         pass
 
     def on_close(self):
         if hasattr(self, "console_handler"):
             logging.getLogger().removeHandler(self.console_handler)
+        if self._drain_job is not None:
+            self.after_cancel(self._drain_job)
         self.destroy()
 
 
+class SaveHistoryViewer(ctk.CTkToplevel):
+    RANGES = {
+        "All": None,
+        "Last 24 hours": 24 * 60 * 60,
+        "Last 7 days": 7 * 24 * 60 * 60,
+        "Last 30 days": 30 * 24 * 60 * 60,
+    }
+
+    def __init__(self, parent, history: "SaveHistory", steam64_id: str):
+        super().__init__(parent)
+        self.title(f"Save History - {steam64_id }")
+        self.geometry("700x450")
+
+        self.history = history
+        self.steam64_id = steam64_id
+
+        self._setup_icon()
+        self._setup_ui()
+        self.refresh()
+
+    def _setup_icon(self):
+        try:
+            icon_path = Path(__file__).parent / "Script Files" / "custom_icon.ico"
+            if icon_path.exists():
+                self.iconbitmap(str(icon_path))
+        except Exception as e:
+            logging.warning(f"Failed to load icon for save history: {e }")
+
+    def _setup_ui(self):
+        controls = ctk.CTkFrame(self, fg_color="transparent")
+        controls.pack(fill="x", padx=10, pady=(10, 0))
+
+        self.range_var = tk.StringVar(value="All")
+        ctk.CTkOptionMenu(
+            controls,
+            values=list(self.RANGES),
+            variable=self.range_var,
+            command=lambda _: self.refresh(),
+        ).pack(side="left")
+        ctk.CTkButton(controls, text="Refresh", width=80, command=self.refresh).pack(
+            side="right"
+        )
+
+        self.history_output = ctk.CTkTextbox(self, activate_scrollbars=True)
+        self.history_output.pack(expand=True, fill=tk.BOTH, padx=10, pady=10)
+
+    def refresh(self):
+        span = self.RANGES[self.range_var.get()]
+        start = time.time() - span if span else None
+
+        try:
+            rows = self.history.query(self.steam64_id, start=start)
+        except sqlite3.Error as e:
+            logging.error(f"Failed to read save history: {e }")
+            rows = []
+
+        lines = [
+            f"{time .strftime ('%Y-%m-%d %H:%M:%S', time .localtime (recorded_at ))}  "
+            f"{source :<8}{field_name :<16}{value }"
+            for recorded_at, source, field_name, value in rows
+        ]
+
+        self.history_output.configure(state="normal")
+        self.history_output.delete("1.0", tk.END)
+        self.history_output.insert(
+            tk.END, "\n".join(lines) if lines else "No history recorded yet."
+        )
+        self.history_output.configure(state="disabled")
+
+
 class SteamManager:
     GAME_ID = "2551020"
     REGISTRY_PATHS = ["SOFTWARE\\WOW6432Node\\Valve\\Steam", "SOFTWARE\\Valve\\Steam"]
+    ROOTS_ENV_VAR = "OAR_STEAM_ROOTS"
+    SCAN_TIMEOUT = 10.0
+    MAX_SCAN_WORKERS = 4
 
-    def __init__(self):
+    def __init__(self, extra_roots: Optional[List[str]] = None):
         self.steam_path = self._find_steam_path()
+        self.steam_roots: List[str] = []
+
+        self._scan_queue: "queue.Queue[str]" = queue.Queue()
+        self._scan_workers: List[threading.Thread] = []
+        self._scan_done = threading.Condition()
+        self._scans_in_progress: Set[str] = set()
+        self._scan_results: Dict[str, tuple] = {}
+
+        env_roots = os.environ.get(self.ROOTS_ENV_VAR, "").split(os.pathsep)
+        for root in [self.steam_path, *env_roots, *(extra_roots or [])]:
+            self.add_root(root)
 
     def _find_steam_path(self) -> Optional[str]:
         for path in self.REGISTRY_PATHS:
@@ -145,14 +317,29 @@ class SteamManager:
                 continue
         return None
 
-    def load_accounts(self) -> Dict[str, AccountInfo]:
-        if not self.steam_path:
-            raise FileNotFoundError("Steam installation not found")
+    def add_root(self, root: Optional[str]) -> bool:
+        if not root or not root.strip():
+            return False
+        root = os.path.normpath(root.strip())
+        if os.path.normcase(root) in map(os.path.normcase, self.steam_roots):
+            return False
+        self.steam_roots.append(root)
+        return True
 
-        accounts = {}
+    def _userdata_dir(self, root: Path) -> Path:
+        if (root / "userdata").is_dir():
+            return root / "userdata"
+        if (root / "config" / "loginusers.vdf").exists():
+            return root / "userdata"
+        return root
+
+    def _scan_root(self, root: str) -> Tuple[List[AccountInfo], Set[str]]:
+        accounts = []
         known_steam3_ids = set()
+        with_game_data = set()
+        userdata_root = self._userdata_dir(Path(root))
 
-        login_file = Path(self.steam_path) / "config" / "loginusers.vdf"
+        login_file = Path(root) / "config" / "loginusers.vdf"
         if login_file.exists():
             try:
                 with open(login_file, "r", encoding="utf-8") as f:
@@ -162,38 +349,145 @@ class SteamManager:
                         account_name = user_data.get("PersonaName", "Unknown")
                         steam3_id = str(int(steam_id64) & 0xFFFFFFFF)
                         userdata_path = (
-                            Path(self.steam_path)
-                            / "userdata"
-                            / steam3_id
-                            / self.GAME_ID
-                            / "remote"
+                            userdata_root / steam3_id / self.GAME_ID / "remote"
                         )
 
-                        accounts[account_name] = AccountInfo(
-                            steam3_id=steam3_id,
-                            steam64_id=steam_id64,
-                            userdata_path=str(userdata_path),
-                            persona_name=account_name,
+                        accounts.append(
+                            AccountInfo(
+                                steam3_id=steam3_id,
+                                steam64_id=steam_id64,
+                                userdata_path=str(userdata_path),
+                                persona_name=account_name,
+                                source_root=root,
+                            )
                         )
                         known_steam3_ids.add(steam3_id)
+                        if userdata_path.parent.is_dir():
+                            with_game_data.add(steam3_id)
             except Exception as e:
-                logging.warning(f"Could not parse loginusers.vdf: {e }")
+                logging.warning(f"Could not parse {login_file }: {e }")
 
-        userdata_root = Path(self.steam_path) / "userdata"
-        if userdata_root.exists() and userdata_root.is_dir():
-            for item in userdata_root.iterdir():
-                if item.is_dir() and item.name.isdigit():
-                    steam3_id = item.name
+        try:
+            with os.scandir(userdata_root) as entries:
+                for entry in entries:
+                    if not entry.name.isdigit() or not entry.is_dir():
+                        continue
+                    steam3_id = entry.name
+                    if os.path.isdir(os.path.join(entry.path, self.GAME_ID)):
+                        with_game_data.add(steam3_id)
                     if steam3_id not in known_steam3_ids:
                         account_name = f"Unknown Account {steam3_id }"
-                        userdata_path = item / self.GAME_ID / "remote"
-
-                        accounts[account_name] = AccountInfo(
-                            steam3_id=steam3_id,
-                            steam64_id=None,
-                            userdata_path=str(userdata_path),
-                            persona_name=account_name,
+                        userdata_path = Path(entry.path) / self.GAME_ID / "remote"
+
+                        accounts.append(
+                            AccountInfo(
+                                steam3_id=steam3_id,
+                                steam64_id=None,
+                                userdata_path=str(userdata_path),
+                                persona_name=account_name,
+                                source_root=root,
+                            )
                         )
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logging.warning(f"Could not scan {userdata_root }: {e }")
+
+        return accounts, with_game_data
+
+    def _scan_worker(self):
+        while True:
+            root = self._scan_queue.get()
+            try:
+                result = self._scan_root(root)
+            except Exception as e:
+                logging.warning(f"Failed to scan {root }: {e }")
+                result = ([], set())
+
+            with self._scan_done:
+                self._scan_results[root] = result
+                self._scans_in_progress.discard(root)
+                self._scan_done.notify_all()
+
+    def _scan_roots(self, roots: List[str]) -> Dict[str, tuple]:
+        with self._scan_done:
+            submitted = set()
+            for root in roots:
+                if root in self._scans_in_progress:
+                    logging.warning(
+                        f"Previous scan of {root } is still running, "
+                        "using its last result"
+                    )
+                    continue
+                self._scans_in_progress.add(root)
+                submitted.add(root)
+                self._scan_queue.put(root)
+
+            while len(self._scan_workers) < min(
+                len(self._scans_in_progress), self.MAX_SCAN_WORKERS
+            ):
+                worker = threading.Thread(target=self._scan_worker, daemon=True)
+                worker.start()
+                self._scan_workers.append(worker)
+
+            deadline = time.monotonic() + self.SCAN_TIMEOUT
+            while submitted & self._scans_in_progress:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                self._scan_done.wait(remaining)
+
+            for root in submitted & self._scans_in_progress:
+                logging.warning(
+                    f"Timed out scanning {root } after {self .SCAN_TIMEOUT }s"
+                )
+            return {
+                root: self._scan_results[root]
+                for root in roots
+                if root in self._scan_results
+            }
+
+    def load_accounts(self) -> Dict[str, AccountInfo]:
+        if not self.steam_roots:
+            raise FileNotFoundError("Steam installation not found")
+
+        roots = list(self.steam_roots)
+        results = self._scan_roots(roots)
+
+        identities: Dict[str, AccountInfo] = {}
+        locations: Dict[str, AccountInfo] = {}
+        for root in roots:
+            if root not in results:
+                continue
+            found, with_game_data = results[root]
+
+            for account in found:
+                existing = identities.get(account.steam3_id)
+                if existing is None or (
+                    existing.steam64_id is None and account.steam64_id is not None
+                ):
+                    identities[account.steam3_id] = account
+                if (
+                    account.steam3_id in with_game_data
+                    and account.steam3_id not in locations
+                ):
+                    locations[account.steam3_id] = account
+
+        by_steam3: Dict[str, AccountInfo] = {}
+        for steam3_id, identity in identities.items():
+            location = locations.get(steam3_id, identity)
+            by_steam3[steam3_id] = replace(
+                identity,
+                userdata_path=location.userdata_path,
+                source_root=location.source_root,
+            )
+
+        accounts = {}
+        for account in by_steam3.values():
+            account_name = account.persona_name
+            if account_name in accounts:
+                account_name = f"{account_name } ({account .steam3_id })"
+            accounts[account_name] = account
 
         if not accounts:
             raise FileNotFoundError(
@@ -202,20 +496,14 @@ class SteamManager:
 
         return accounts
 
-    def ensure_game_directories(self, steam3_id: str) -> str:
-        if not self.steam_path:
-            raise ValueError("Steam path not available")
-        remote_path = (
-            Path(self.steam_path) / "userdata" / steam3_id / self.GAME_ID / "remote"
-        )
+    def ensure_game_directories(self, account: AccountInfo) -> str:
+        remote_path = Path(account.userdata_path)
         remote_path.mkdir(parents=True, exist_ok=True)
         return str(remote_path)
 
-    def create_backup(self, steam3_id: str, backup_root: Path):
-        if not self.steam_path:
-            return
-        backup_folder = backup_root / steam3_id
-        backup_source = Path(self.steam_path) / "userdata" / steam3_id / self.GAME_ID
+    def create_backup(self, account: AccountInfo, backup_root: Path):
+        backup_folder = backup_root / account.steam3_id
+        backup_source = Path(account.userdata_path).parent
         if backup_source.exists() and not backup_folder.exists():
             try:
                 shutil.copytree(backup_source, backup_folder)
@@ -224,11 +512,277 @@ class SteamManager:
                 logging.error(f"Failed to create backup: {e }")
 
 
+class TemplateBundle:
+    MAGIC = b"OARB"
+    VERSION = 2
+    HEADER = struct.Struct("<4sHHI")
+    ENTRY = struct.Struct("<IIB")
+    PLACEHOLDER = struct.Struct("<H")
+
+    def __init__(
+        self,
+        templates: Dict[str, bytes],
+        offsets: Dict[str, Dict[bytes, List[int]]],
+        placeholders: List[bytes],
+    ):
+        self.templates = templates
+        self.offsets = offsets
+        self.placeholders = placeholders
+
+    @classmethod
+    def from_directory(
+        cls, script_files_dir: Path, save_types: List[str], placeholders: List[bytes]
+    ):
+        templates = {}
+        offsets = {}
+        for save_type in save_types:
+            script_path = script_files_dir / f"{save_type }.sav"
+            if not script_path.exists():
+                continue
+            contents = script_path.read_bytes()
+            templates[save_type] = contents
+            offsets[save_type] = cls._find_placeholders(contents, placeholders)
+        return cls(templates, offsets, placeholders)
+
+    @classmethod
+    def _find_placeholders(
+        cls, contents: bytes, placeholders: List[bytes]
+    ) -> Dict[bytes, List[int]]:
+        found = {}
+        for placeholder in placeholders:
+            positions = []
+            index = contents.find(placeholder)
+            while index != -1:
+                positions.append(index)
+                index = contents.find(placeholder, index + len(placeholder))
+            if positions:
+                found[placeholder] = positions
+        return found
+
+    @classmethod
+    def _checksum(cls, data: bytes) -> int:
+        checksum_offset = cls.HEADER.size - 4
+        return zlib.crc32(data[cls.HEADER.size :], zlib.crc32(data[:checksum_offset]))
+
+    @classmethod
+    def load(cls, bundle_path: Path):
+        data = bundle_path.read_bytes()
+        if len(data) < cls.HEADER.size:
+            raise ValueError(f"Template bundle is truncated: {bundle_path }")
+
+        magic, version, count, checksum = cls.HEADER.unpack_from(data)
+        if cls._checksum(data) != checksum:
+            raise ValueError(f"Template bundle checksum mismatch: {bundle_path }")
+        if magic != cls.MAGIC or version != cls.VERSION:
+            raise ValueError(f"Unsupported template bundle: {bundle_path }")
+
+        cursor = cls.HEADER.size
+
+        def take(size: int) -> bytes:
+            nonlocal cursor
+            if cursor + size > len(data):
+                raise ValueError(f"Template bundle is truncated: {bundle_path }")
+            chunk = data[cursor : cursor + size]
+            cursor += size
+            return chunk
+
+        templates = {}
+        offsets = {}
+        try:
+            placeholders = [take(take(1)[0]) for _ in range(take(1)[0])]
+            for _ in range(count):
+                name = take(take(1)[0]).decode("utf-8")
+                data_offset, data_len, placeholder_count = cls.ENTRY.unpack(
+                    take(cls.ENTRY.size)
+                )
+                if data_offset + data_len > len(data):
+                    raise ValueError(f"Template bundle is truncated: {bundle_path }")
+                templates[name] = data[data_offset : data_offset + data_len]
+
+                offsets[name] = {}
+                for _ in range(placeholder_count):
+                    placeholder = take(take(1)[0])
+                    (occurrences,) = cls.PLACEHOLDER.unpack(
+                        take(cls.PLACEHOLDER.size)
+                    )
+                    offsets[name][placeholder] = list(
+                        struct.unpack(f"<{occurrences }I", take(4 * occurrences))
+                    )
+        except UnicodeDecodeError as e:
+            raise ValueError(f"Template bundle is corrupt: {bundle_path }: {e }")
+
+        return cls(templates, offsets, placeholders)
+
+    def save(self, bundle_path: Path):
+        blobs = bytearray()
+        names = list(self.templates)
+
+        index = bytearray([len(self.placeholders)])
+        for placeholder in self.placeholders:
+            index += bytes([len(placeholder)]) + placeholder
+
+        index_size = len(index)
+        for name in names:
+            index_size += 1 + len(name.encode("utf-8")) + self.ENTRY.size
+            for placeholder, positions in self.offsets[name].items():
+                index_size += 1 + len(placeholder) + self.PLACEHOLDER.size
+                index_size += 4 * len(positions)
+
+        data_offset = self.HEADER.size + index_size
+        for name in names:
+            encoded_name = name.encode("utf-8")
+            contents = self.templates[name]
+            index += bytes([len(encoded_name)]) + encoded_name
+            index += self.ENTRY.pack(
+                data_offset + len(blobs), len(contents), len(self.offsets[name])
+            )
+            for placeholder, positions in self.offsets[name].items():
+                index += bytes([len(placeholder)]) + placeholder
+                index += self.PLACEHOLDER.pack(len(positions))
+                index += struct.pack(f"<{len (positions )}I", *positions)
+            blobs += contents
+
+        data = self.HEADER.pack(self.MAGIC, self.VERSION, len(names), 0) + bytes(
+            index + blobs
+        )
+        header = self.HEADER.pack(
+            self.MAGIC, self.VERSION, len(names), self._checksum(data)
+        )
+        bundle_path.write_bytes(header + data[self.HEADER.size :])
+
+    def render(self, file_type: str, replacements: Dict[bytes, bytes]) -> bytes:
+        if file_type not in self.templates:
+            raise FileNotFoundError(f"Template not found: {file_type }")
+
+        missing = [p for p in replacements if p not in self.offsets[file_type]]
+        if missing:
+            names = ", ".join(p.decode(errors="replace") for p in missing)
+            raise ValueError(f"Template {file_type } has no placeholder {names }")
+
+        contents = self.templates[file_type]
+        splices = sorted(
+            (position, placeholder)
+            for placeholder, positions in self.offsets[file_type].items()
+            if placeholder in replacements
+            for position in positions
+        )
+
+        parts = []
+        cursor = 0
+        for position, placeholder in splices:
+            parts.append(contents[cursor:position])
+            parts.append(replacements[placeholder])
+            cursor = position + len(placeholder)
+        parts.append(contents[cursor:])
+        return b"".join(parts)
+
+
 class SaveFileManager:
     SAVE_TYPES = ["Cash", "Level", "InventoryItems", "Maps"]
+    BUNDLE_NAME = "templates.oarb"
+    USER_ID_PLACEHOLDER = b"my_stupid_user_id"
+    ENCODINGS = {
+        "int32": ("IntProperty", struct.Struct("<i")),
+        "array_count": ("ArrayProperty", struct.Struct("<I")),
+    }
+    FIELDS = [
+        FieldSpec(
+            "items",
+            "Unlock Items & Cosmetics",
+            "InventoryItems",
+            "InventoryItemsSave",
+            "array_count",
+            replaces_file=True,
+        ),
+        FieldSpec(
+            "maps",
+            "Unlock Maps",
+            "Maps",
+            "MapsSave",
+            "array_count",
+            replaces_file=True,
+        ),
+        FieldSpec(
+            "cash",
+            "Edit Cash:",
+            "Cash",
+            "CashSave",
+            "int32",
+            placeholder=b"my_stupid_cash_id",
+            secure_path="SecureCashSave",
+        ),
+        FieldSpec(
+            "level",
+            "Edit Level:",
+            "Level",
+            "LevelSave",
+            "int32",
+            placeholder=b"my_stupid_level_id",
+            secure_path="SecureLevelSave",
+        ),
+    ]
 
     def __init__(self, script_files_dir: Path):
         self.script_files_dir = script_files_dir
+        self._bundle: Optional[TemplateBundle] = None
+
+    @property
+    def placeholders(self) -> List[bytes]:
+        return [self.USER_ID_PLACEHOLDER] + [
+            spec.placeholder for spec in self.FIELDS if spec.placeholder is not None
+        ]
+
+    @property
+    def bundle(self) -> TemplateBundle:
+        if self._bundle is None:
+            bundle_path = self.script_files_dir / self.BUNDLE_NAME
+            if bundle_path.exists() and not self._bundle_is_stale(bundle_path):
+                self._bundle = self._load_bundle_file(bundle_path)
+
+            if self._bundle is None:
+                self._bundle = TemplateBundle.from_directory(
+                    self.script_files_dir, self.SAVE_TYPES, self.placeholders
+                )
+                logging.info(f"Loaded loose templates from: {self .script_files_dir }")
+        return self._bundle
+
+    def _load_bundle_file(self, bundle_path: Path) -> Optional[TemplateBundle]:
+        try:
+            bundle = TemplateBundle.load(bundle_path)
+        except ValueError as e:
+            logging.warning(f"Ignoring unreadable template bundle: {e }")
+            return None
+
+        if set(bundle.placeholders) != set(self.placeholders):
+            logging.warning(
+                f"Ignoring template bundle built for different fields: {bundle_path }"
+            )
+            return None
+
+        logging.info(f"Loaded template bundle: {bundle_path }")
+        return bundle
+
+    def _bundle_is_stale(self, bundle_path: Path) -> bool:
+        bundle_mtime = bundle_path.stat().st_mtime
+        for save_type in self.SAVE_TYPES:
+            script_path = self.script_files_dir / f"{save_type }.sav"
+            if script_path.exists() and script_path.stat().st_mtime > bundle_mtime:
+                logging.warning(
+                    f"Ignoring stale template bundle, {script_path } is newer"
+                )
+                return True
+        return False
+
+    def build_bundle(self) -> Path:
+        bundle_path = self.script_files_dir / self.BUNDLE_NAME
+        bundle = TemplateBundle.from_directory(
+            self.script_files_dir, self.SAVE_TYPES, self.placeholders
+        )
+        missing = [t for t in self.SAVE_TYPES if t not in bundle.templates]
+        if missing:
+            raise FileNotFoundError(f"Script files not found: {', '.join (missing )}")
+        bundle.save(bundle_path)
+        return bundle_path
 
     def generate_save_filenames(
         self, steam64_id: str, remote_dir: str
@@ -241,32 +795,267 @@ class SaveFileManager:
             for save_type in self.SAVE_TYPES
         }
 
-    def apply_save_modification(
+    def render_fields(
         self,
-        file_type: str,
+        save_type: str,
         steam64_id: str,
-        remote_dir: str,
-        duplicate_file: Optional[str] = None,
-        old_key: Optional[bytes] = None,
-        new_key: Optional[bytes] = None,
-    ):
-        script_path = self.script_files_dir / f"{file_type }.sav"
-        if not script_path.exists():
-            raise FileNotFoundError(f"Script file not found: {script_path }")
+        selections: Dict[FieldSpec, object],
+        existing: Optional[bytes] = None,
+    ) -> bytes:
+        values = {
+            spec: value
+            for spec, value in selections.items()
+            if spec.save_type == save_type and not spec.replaces_file
+        }
+        replaces_file = any(
+            spec.replaces_file and spec.save_type == save_type for spec in selections
+        )
+
+        if existing is not None and not replaces_file:
+            patched = self._patch_fields(existing, values)
+            if patched is not None:
+                return patched
+            logging.warning(
+                f"Existing {save_type } save has an unexpected layout, "
+                "rebuilding it from the template"
+            )
 
-        with open(script_path, "rb") as file:
-            contents = file.read()
+        return self._render_template(save_type, steam64_id, values, existing)
 
-        contents = contents.replace(b"my_stupid_user_id", steam64_id.encode())
-        if old_key is not None and new_key is not None:
-            contents = contents.replace(old_key, new_key)
+    def _render_template(
+        self,
+        save_type: str,
+        steam64_id: str,
+        values: Dict[FieldSpec, object],
+        existing: Optional[bytes] = None,
+    ) -> bytes:
+        replacements = {self.USER_ID_PLACEHOLDER: steam64_id.encode()}
+        patches = {}
+
+        for spec in self.FIELDS:
+            if spec.save_type != save_type or spec.replaces_file:
+                continue
 
+            value = values.get(spec)
+            if value is None and existing is not None:
+                value = self.read_property_value(existing, spec)
+            if value is None:
+                if spec.placeholder is None:
+                    continue
+                value = 0
+
+            if spec.placeholder is not None:
+                replacements[spec.placeholder] = self.ENCODINGS[spec.encoding][1].pack(
+                    value
+                )
+            else:
+                patches[spec] = value
+
+        contents = self.bundle.render(save_type, replacements)
+        patched = self._patch_fields(contents, patches)
+        if patched is None:
+            raise ValueError(f"{save_type } template is missing a registered property")
+        return patched
+
+    def _patch_fields(
+        self, contents: bytes, values: Dict[FieldSpec, object]
+    ) -> Optional[bytes]:
+        patched = bytearray(contents)
+        for spec, value in values.items():
+            offsets = self._value_offsets(patched, spec)
+            if offsets is None:
+                return None
+            encoded = self.ENCODINGS[spec.encoding][1].pack(value)
+            for offset in offsets:
+                patched[offset : offset + len(encoded)] = encoded
+        return bytes(patched)
+
+    def resolve_target_paths(
+        self,
+        file_type: str,
+        steam64_id: str,
+        remote_dir: str,
+        duplicate_file: Optional[str] = None,
+    ) -> List[Path]:
         files_to_write = [Path(remote_dir) / f"{steam64_id }{file_type }.sav"]
         if duplicate_file and Path(duplicate_file).parent.exists():
             files_to_write.append(Path(duplicate_file))
+        return files_to_write
 
-        for file_path in files_to_write:
-            self._write_save_file(file_path, contents)
+    def build_plan(
+        self,
+        steam64_id: str,
+        remote_dir: str,
+        selections: Dict[FieldSpec, object],
+        duplicate_files: Dict[str, str],
+    ) -> ApplyPlan:
+        plan = ApplyPlan(steam64_id=steam64_id)
+
+        if not Path(remote_dir).is_dir():
+            plan.problems.append(f"Save directory does not exist: {remote_dir }")
+            return plan
+
+        save_types = []
+        for spec in selections:
+            if spec.save_type not in save_types:
+                save_types.append(spec.save_type)
+
+        for save_type in save_types:
+            try:
+                existing = self.read_existing_save(
+                    save_type, steam64_id, remote_dir, duplicate_files
+                )
+                contents = self.render_fields(
+                    save_type, steam64_id, selections, existing
+                )
+            except (OSError, ValueError, struct.error) as e:
+                plan.problems.append(str(e))
+                continue
+
+            for file_path in self.resolve_target_paths(
+                save_type,
+                steam64_id,
+                remote_dir,
+                duplicate_files.get(f"{save_type }Save"),
+            ):
+                plan.writes.append(PlannedWrite(save_type, file_path, contents))
+
+        self._check_writability(plan)
+        self._check_free_space(plan)
+        return plan
+
+    def _check_writability(self, plan: ApplyPlan):
+        for write in plan.writes:
+            target = write.path if write.path.exists() else write.path.parent
+            if not os.access(target, os.W_OK):
+                plan.problems.append(f"Not writable: {target }")
+
+    def _check_free_space(self, plan: ApplyPlan):
+        required: Dict[Path, int] = {}
+        for write in plan.writes:
+            existing = write.path.stat().st_size if write.path.exists() else 0
+            required[write.path.parent] = required.get(write.path.parent, 0) + max(
+                len(write.contents) - existing, 0
+            )
+
+        for directory, needed in required.items():
+            try:
+                free = shutil.disk_usage(directory).free
+            except OSError as e:
+                plan.problems.append(f"Could not check free space in {directory }: {e }")
+                continue
+            if needed > free:
+                plan.problems.append(
+                    f"Not enough free space in {directory }: "
+                    f"{needed :,} bytes needed, {free :,} available"
+                )
+
+    def execute_plan(self, plan: ApplyPlan):
+        if plan.problems:
+            raise ValueError("Cannot execute a plan with unresolved problems")
+        for write in plan.writes:
+            self._write_save_file(write.path, write.contents)
+
+    @staticmethod
+    def _fstring(text: str) -> bytes:
+        encoded = text.encode("utf-8") + b"\x00"
+        return struct.pack("<i", len(encoded)) + encoded
+
+    def _property_value_offset(self, contents: bytes, spec: FieldSpec) -> Optional[int]:
+        property_type, value_struct = self.ENCODINGS[spec.encoding]
+        header = self._fstring(spec.property_path) + self._fstring(property_type)
+        index = contents.find(header)
+        if index == -1:
+            return None
+        cursor = index + len(header) + 8
+
+        if property_type == "ArrayProperty":
+            (inner_len,) = struct.unpack_from("<i", contents, cursor)
+            cursor += 4 + inner_len
+        cursor += 1
+
+        if cursor + value_struct.size > len(contents):
+            return None
+        return cursor
+
+    def _secure_key_offset(self, contents: bytes, secure_path: str) -> Optional[int]:
+        header = self._fstring(secure_path) + self._fstring("MapProperty")
+        index = contents.find(header)
+        if index == -1:
+            return None
+        cursor = index + len(header) + 8
+
+        for _ in range(2):
+            (type_len,) = struct.unpack_from("<i", contents, cursor)
+            cursor += 4 + type_len
+        cursor += 1
+
+        removed, count = struct.unpack_from("<II", contents, cursor)
+        cursor += 8
+        if removed != 0 or count < 1 or cursor + 4 > len(contents):
+            return None
+        return cursor
+
+    def _value_offsets(self, contents: bytes, spec: FieldSpec) -> Optional[List[int]]:
+        offset = self._property_value_offset(contents, spec)
+        if offset is None:
+            return None
+        offsets = [offset]
+
+        if spec.secure_path is not None:
+            secure_offset = self._secure_key_offset(contents, spec.secure_path)
+            if secure_offset is None:
+                return None
+            offsets.append(secure_offset)
+        return offsets
+
+    def read_property_value(self, contents: bytes, spec: FieldSpec):
+        offset = self._property_value_offset(contents, spec)
+        if offset is None:
+            return None
+        return self.ENCODINGS[spec.encoding][1].unpack_from(contents, offset)[0]
+
+    def _save_candidates(
+        self,
+        save_type: str,
+        steam64_id: str,
+        remote_dir: str,
+        duplicate_files: Dict[str, str],
+    ) -> List[Path]:
+        candidates = [duplicate_files.get(f"{save_type }Save")]
+        candidates.append(str(Path(remote_dir) / f"{steam64_id }{save_type }.sav"))
+        return [Path(c) for c in candidates if c and Path(c).is_file()]
+
+    def read_existing_save(
+        self,
+        save_type: str,
+        steam64_id: str,
+        remote_dir: str,
+        duplicate_files: Dict[str, str],
+    ) -> Optional[bytes]:
+        for candidate in self._save_candidates(
+            save_type, steam64_id, remote_dir, duplicate_files
+        ):
+            return candidate.read_bytes()
+        return None
+
+    def read_save_values(
+        self, steam64_id: str, remote_dir: str, duplicate_files: Dict[str, str]
+    ) -> Dict[str, int]:
+        values = {}
+        for spec in self.FIELDS:
+            for candidate in self._save_candidates(
+                spec.save_type, steam64_id, remote_dir, duplicate_files
+            ):
+                try:
+                    value = self.read_property_value(candidate.read_bytes(), spec)
+                except (OSError, struct.error) as e:
+                    logging.warning(f"Could not read {candidate }: {e }")
+                    continue
+                if value is not None:
+                    values[spec.key] = value
+                    break
+        return values
 
     def _write_save_file(self, file_path: Path, contents: bytes):
         try:
@@ -278,25 +1067,106 @@ class SaveFileManager:
             raise
 
 
+class SaveHistory:
+    def __init__(self, db_path: Path):
+        self.db_path = db_path
+        self._connection: Optional[sqlite3.Connection] = None
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        if self._connection is None:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            self._connection = sqlite3.connect(str(self.db_path))
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS samples ("
+                "steam64_id INTEGER NOT NULL, "
+                "recorded_at REAL NOT NULL, "
+                "field TEXT NOT NULL, "
+                "source TEXT NOT NULL, "
+                "value INTEGER NOT NULL, "
+                "PRIMARY KEY (steam64_id, recorded_at, field)"
+                ") WITHOUT ROWID"
+            )
+        return self._connection
+
+    def latest(self, steam64_id: str) -> Dict[str, int]:
+        rows = self.connection.execute(
+            "SELECT field, value FROM samples s WHERE steam64_id = ? "
+            "AND recorded_at = (SELECT MAX(recorded_at) FROM samples "
+            "WHERE steam64_id = s.steam64_id AND field = s.field)",
+            (int(steam64_id),),
+        )
+        return dict(rows.fetchall())
+
+    def record(
+        self,
+        steam64_id: str,
+        values: Dict[str, int],
+        source: str,
+        recorded_at: Optional[float] = None,
+    ) -> int:
+        recorded_at = time.time() if recorded_at is None else recorded_at
+        previous = self.latest(steam64_id)
+        changed = [
+            (int(steam64_id), recorded_at, field_name, source, value)
+            for field_name, value in values.items()
+            if previous.get(field_name) != value
+        ]
+        if changed:
+            with self.connection:
+                self.connection.executemany(
+                    "INSERT OR REPLACE INTO samples VALUES (?, ?, ?, ?, ?)", changed
+                )
+        return len(changed)
+
+    def query(
+        self,
+        steam64_id: str,
+        start: Optional[float] = None,
+        end: Optional[float] = None,
+    ) -> List[tuple]:
+        rows = self.connection.execute(
+            "SELECT recorded_at, source, field, value FROM samples "
+            "WHERE steam64_id = ? AND recorded_at >= ? AND recorded_at <= ? "
+            "ORDER BY recorded_at, field",
+            (
+                int(steam64_id),
+                float("-inf") if start is None else start,
+                float("inf") if end is None else end,
+            ),
+        )
+        return rows.fetchall()
+
+
 class OARTool:
-    def __init__(self):
+    def __init__(self, dry_run: bool = False):
         self.log_history: List[str] = []
         self._setup_logging()
 
         self.steam_manager = SteamManager()
         logging.info(f"Steam path: {self .steam_manager .steam_path }")
+        logging.info(f"Steam roots: {', '.join (self .steam_manager .steam_roots )}")
         self.script_files_dir = Path(__file__).parent / "Script Files"
         self.save_manager = SaveFileManager(self.script_files_dir)
+        self.save_history = SaveHistory(self._user_data_dir() / "OAR history.sqlite3")
 
         self.account_data: Dict[str, AccountInfo] = {}
         self.duplicate_files: Dict[str, str] = {}
         self.remote_directory: Optional[str] = None
+        self.current_steam64_id: Optional[str] = None
         self.is_advanced_mode = False
+        self.dry_run = dry_run
         self.debug_console: Optional[DebugConsole] = None
+        self.history_viewer: Optional[SaveHistoryViewer] = None
 
         self._setup_window()
         self._initialize_app()
 
+    @staticmethod
+    def _user_data_dir() -> Path:
+        base_dir = os.environ.get("LOCALAPPDATA") or str(Path.home())
+        return Path(base_dir) / "OAR Tool"
+
     def _setup_logging(self):
         class ListHandler(logging.Handler):
             def __init__(self, log_list):
@@ -341,7 +1211,7 @@ class OARTool:
             logging.warning(f"Failed to load icon: {e }")
 
     def _initialize_app(self):
-        if not self.steam_manager.steam_path:
+        if not self.steam_manager.steam_roots:
             messagebox.showinfo(
                 "Steam Not Found",
                 "Steam could not be automatically detected. Use advanced mode to continue.",
@@ -385,13 +1255,27 @@ class OARTool:
         options = [
             ("Normal Mode", lambda: self.set_mode(False)),
             ("Advanced Mode", lambda: self.set_mode(True)),
+            ("Add Steam Folder...", self._add_steam_root),
         ]
         CTkMenu(self.window, button, options)
 
+    def _add_steam_root(self):
+        directory = filedialog.askdirectory(
+            title="Select Steam Or Userdata Folder",
+            initialdir=self.steam_manager.steam_path or "/",
+        )
+        if not directory:
+            return
+
+        if self.steam_manager.add_root(directory):
+            logging.info(f"Steam root added: {directory }")
+        self.set_mode(False)
+
     def _show_help_menu(self, button):
         options = [
             ("About", self._show_about),
             ("Debug Console", self._show_debug_console),
+            ("Save History", self._show_save_history),
         ]
         CTkMenu(self.window, button, options)
 
@@ -402,6 +1286,37 @@ class OARTool:
         else:
             self.debug_console.lift()
 
+    def _show_save_history(self):
+        if not self.current_steam64_id:
+            messagebox.showinfo("Save History", "Select an account first.")
+            return
+
+        if (
+            self.history_viewer is None
+            or not self.history_viewer.winfo_exists()
+            or self.history_viewer.steam64_id != self.current_steam64_id
+        ):
+            if self.history_viewer is not None and self.history_viewer.winfo_exists():
+                self.history_viewer.destroy()
+            self.history_viewer = SaveHistoryViewer(
+                self.window, self.save_history, self.current_steam64_id
+            )
+        else:
+            self.history_viewer.refresh()
+            self.history_viewer.lift()
+
+    def _record_history(self, steam64_id: str, source: str):
+        if not self.remote_directory:
+            return
+        try:
+            values = self.save_manager.read_save_values(
+                steam64_id, self.remote_directory, self.duplicate_files
+            )
+            recorded = self.save_history.record(steam64_id, values, source)
+            logging.info(f"Save history: {recorded } changed value(s) recorded")
+        except (sqlite3.Error, OSError, ValueError) as e:
+            logging.warning(f"Failed to record save history: {e }")
+
     def set_mode(self, advanced: bool):
         if self.is_advanced_mode != advanced:
             mode_name = "Advanced" if advanced else "Normal"
@@ -410,7 +1325,7 @@ class OARTool:
 
         if advanced:
             self.show_advanced_screen()
-        elif self.steam_manager.steam_path:
+        elif self.steam_manager.steam_roots:
             self.show_selection_screen()
         else:
             messagebox.showerror(
@@ -494,25 +1409,49 @@ class OARTool:
         self._load_accounts(scroll)
 
     def _load_accounts(self, parent_frame):
-        if not self.steam_manager.steam_path:
+        if not self.steam_manager.steam_roots:
             ctk.CTkLabel(
                 parent_frame, text="Steam installation not found!", text_color="red"
             ).pack()
             return
 
-        try:
-            self.account_data = self.steam_manager.load_accounts()
+        status_label = ctk.CTkLabel(parent_frame, text="Searching for accounts...")
+        status_label.pack()
 
-            for account_name in sorted(self.account_data.keys()):
-                ctk.CTkButton(
-                    parent_frame,
-                    text=account_name,
-                    command=lambda name=account_name: self._select_account(name),
-                ).pack(pady=5, fill="x")
+        result = {}
 
-        except Exception as e:
+        def scan():
+            try:
+                result["accounts"] = self.steam_manager.load_accounts()
+            except Exception as e:
+                result["error"] = e
+
+        threading.Thread(target=scan, daemon=True).start()
+        self._poll_accounts(parent_frame, status_label, result)
+
+    def _poll_accounts(self, parent_frame, status_label, result: dict):
+        if not parent_frame.winfo_exists():
+            return
+        if not result:
+            self.window.after(
+                100, lambda: self._poll_accounts(parent_frame, status_label, result)
+            )
+            return
+
+        status_label.destroy()
+        if "error" in result:
+            e = result["error"]
             messagebox.showerror("Error", f"Failed to load Steam accounts: {e }")
             logging.error(f"Failed to load accounts: {e }")
+            return
+
+        self.account_data = result["accounts"]
+        for account_name in sorted(self.account_data.keys()):
+            ctk.CTkButton(
+                parent_frame,
+                text=account_name,
+                command=lambda name=account_name: self._select_account(name),
+            ).pack(pady=5, fill="x")
 
     def show_advanced_screen(self, prefill_save_dir: Optional[str] = None):
         self._clear_window()
@@ -581,6 +1520,10 @@ class OARTool:
             messagebox.showerror("Error", "Steam64 ID must be a valid number.")
             return
 
+        if int(steam64_id) > 0x7FFFFFFFFFFFFFFF:
+            messagebox.showerror("Error", "Steam64 ID is too large.")
+            return
+
         if not save_dir or not Path(save_dir).is_dir():
             messagebox.showerror("Error", "Invalid save directory")
             return
@@ -593,49 +1536,46 @@ class OARTool:
         self.show_edit_screen(steam64_id)
 
     def show_edit_screen(self, steam64_id: str):
+        self.current_steam64_id = steam64_id
+        self._record_history(steam64_id, "session")
+
         self._clear_window()
-        self.window.geometry("300x250")
+        self.window.geometry(f"300x{160 + 30 * len (self .save_manager .FIELDS )}")
 
-        form_vars = {
-            "cash": tk.IntVar(),
-            "level": tk.IntVar(),
-            "edit_cash": tk.BooleanVar(),
-            "edit_level": tk.BooleanVar(),
-            "edit_items": tk.BooleanVar(),
-            "edit_maps": tk.BooleanVar(),
+        form_vars: Dict[str, tk.Variable] = {
+            "dry_run": tk.BooleanVar(value=self.dry_run),
         }
 
         ctk.CTkLabel(
             self.main_frame, text="Made By FireNinja7365", font=("Arial", 10)
         ).pack()
 
-        ctk.CTkCheckBox(
-            self.main_frame,
-            text="Unlock Items & Cosmetics",
-            variable=form_vars["edit_items"],
-        ).pack(anchor="w", padx=10, pady=2)
+        for spec in self.save_manager.FIELDS:
+            form_vars[f"edit_{spec .key }"] = tk.BooleanVar()
 
-        ctk.CTkCheckBox(
-            self.main_frame, text="Unlock Maps", variable=form_vars["edit_maps"]
-        ).pack(anchor="w", padx=10, pady=2)
+            if spec.replaces_file:
+                ctk.CTkCheckBox(
+                    self.main_frame,
+                    text=spec.label,
+                    variable=form_vars[f"edit_{spec .key }"],
+                ).pack(anchor="w", padx=10, pady=2)
+                continue
 
-        f_cash = ctk.CTkFrame(self.main_frame, fg_color="transparent")
-        f_cash.pack(fill="x", padx=10, pady=2)
-        ctk.CTkCheckBox(
-            f_cash, text="Edit Cash:", variable=form_vars["edit_cash"]
-        ).pack(side="left")
-        ctk.CTkEntry(f_cash, textvariable=form_vars["cash"], width=100).pack(
-            side="right"
-        )
+            form_vars[spec.key] = tk.IntVar()
+            row = ctk.CTkFrame(self.main_frame, fg_color="transparent")
+            row.pack(fill="x", padx=10, pady=2)
+            ctk.CTkCheckBox(
+                row, text=spec.label, variable=form_vars[f"edit_{spec .key }"]
+            ).pack(side="left")
+            ctk.CTkEntry(row, textvariable=form_vars[spec.key], width=100).pack(
+                side="right"
+            )
 
-        f_lvl = ctk.CTkFrame(self.main_frame, fg_color="transparent")
-        f_lvl.pack(fill="x", padx=10, pady=2)
         ctk.CTkCheckBox(
-            f_lvl, text="Edit Level:", variable=form_vars["edit_level"]
-        ).pack(side="left")
-        ctk.CTkEntry(f_lvl, textvariable=form_vars["level"], width=100).pack(
-            side="right"
-        )
+            self.main_frame,
+            text="Dry Run (preview only)",
+            variable=form_vars["dry_run"],
+        ).pack(anchor="w", padx=10, pady=2)
 
         btn_f = ctk.CTkFrame(self.main_frame, fg_color="transparent")
         btn_f.pack(fill="x", side="bottom", pady=5)
@@ -663,22 +1603,23 @@ class OARTool:
             if account_info.steam64_id is None:
                 logging.warning(f"Unknown account selected: {account_name }")
                 logging.info("Redirecting to Advanced Mode with pre-filled path.")
-                self.steam_manager.ensure_game_directories(account_info.steam3_id)
+                self.steam_manager.ensure_game_directories(account_info)
                 self.set_mode(True)
                 self.show_advanced_screen(prefill_save_dir=account_info.userdata_path)
                 return
 
             self.remote_directory = self.steam_manager.ensure_game_directories(
-                account_info.steam3_id
+                account_info
             )
 
             logging.info(f"Account selected: {account_name }")
             logging.info(f"Account folder: {account_info .steam3_id }")
+            logging.info(f"Account source: {account_info .source_root }")
             logging.info(f"Account ID: {account_info .steam64_id }")
 
             backup_root = Path(__file__).parent / "OAR backup"
             backup_root.mkdir(exist_ok=True)
-            self.steam_manager.create_backup(account_info.steam3_id, backup_root)
+            self.steam_manager.create_backup(account_info, backup_root)
 
             self.duplicate_files = self.save_manager.generate_save_filenames(
                 account_info.steam64_id, self.remote_directory
@@ -690,63 +1631,83 @@ class OARTool:
             messagebox.showerror("Error", f"Failed to select account: {e }")
             logging.error(f"Account selection failed: {e }")
 
-    def _validate_number_input(self, value: int) -> bool:
-        if not (-2147483648 <= value <= 2147483647):
-            messagebox.showinfo(
-                "Information",
-                "Invalid Value! Must be between -2,147,483,648 and 2,147,483,647",
-            )
-            return False
-        return True
+    def _collect_selections(
+        self, form_vars: Dict[str, tk.Variable]
+    ) -> Tuple[Dict[FieldSpec, object], List[str]]:
+        selections: Dict[FieldSpec, object] = {}
+        problems = []
+
+        for spec in self.save_manager.FIELDS:
+            if not form_vars[f"edit_{spec .key }"].get():
+                continue
+
+            if spec.replaces_file:
+                logging.info(f"Unlocking {spec .save_type .lower ()}")
+                selections[spec] = None
+                continue
+
+            try:
+                value = form_vars[spec.key].get()
+            except tk.TclError:
+                problems.append(f"{spec .key .capitalize ()} must be a whole number")
+                continue
+            problem = spec.validate(value)
+            if problem:
+                problems.append(f"Invalid Value! {problem }")
+                continue
+
+            logging.info(f"Editing {spec .save_type .lower ()} to: {value }")
+            selections[spec] = value
+
+        return selections, problems
 
     def _apply_changes(self, form_vars: Dict[str, tk.Variable], steam64_id: str):
         if not self.remote_directory:
             messagebox.showerror("Error", "No save directory available")
             return
 
-        logging.info(f"Applying changes for Steam64 ID: {steam64_id }")
-        changes_made = False
+        dry_run = bool(form_vars["dry_run"].get())
+        logging.info(
+            f"{'Planning' if dry_run else 'Applying'} changes for Steam64 ID: {steam64_id }"
+        )
 
         try:
-            modifications = [
-                ("edit_cash", "cash", "Cash", b"my_stupid_cash_id"),
-                ("edit_level", "level", "Level", b"my_stupid_level_id"),
-                ("edit_items", None, "InventoryItems", None),
-                ("edit_maps", None, "Maps", None),
-            ]
-
-            for edit_var, value_var, file_type, old_key in modifications:
-                if form_vars[edit_var].get():
-                    new_key = None
-
-                    if value_var:
-                        value = form_vars[value_var].get()
-                        if not self._validate_number_input(value):
-                            return
-                        new_key = value.to_bytes(4, byteorder="little", signed=True)
-                        logging.info(f"Editing {file_type .lower ()} to: {value }")
-                    else:
-                        logging.info(f"Unlocking {file_type .lower ()}")
-
-                    self.save_manager.apply_save_modification(
-                        file_type,
-                        steam64_id,
-                        self.remote_directory,
-                        self.duplicate_files.get(f"{file_type }Save"),
-                        old_key,
-                        new_key,
-                    )
-                    changes_made = True
+            selections, problems = self._collect_selections(form_vars)
+            if problems:
+                for problem in problems:
+                    logging.warning(problem)
+                messagebox.showinfo("Information", "\n".join(problems))
+                return
 
-            if changes_made:
-                logging.info("Changes applied successfully!")
-                messagebox.showinfo("Success", "Changes applied successfully!")
-            else:
+            if not selections:
                 logging.info("No changes were made")
                 messagebox.showinfo(
                     "Nothing Changed",
                     "No changes were made!\nMaybe try selecting something?",
                 )
+                return
+
+            plan = self.save_manager.build_plan(
+                steam64_id, self.remote_directory, selections, self.duplicate_files
+            )
+            logging.info(plan.describe())
+
+            if plan.problems:
+                messagebox.showerror(
+                    "Error",
+                    "Preflight check failed, nothing was written:\n"
+                    + "\n".join(plan.problems),
+                )
+                return
+
+            if dry_run:
+                messagebox.showinfo("Dry Run", plan.describe())
+                return
+
+            self.save_manager.execute_plan(plan)
+            self._record_history(steam64_id, "apply")
+            logging.info("Changes applied successfully!")
+            messagebox.showinfo("Success", "Changes applied successfully!")
 
         except Exception as e:
             error_msg = f"Failed to apply changes: {e }"
@@ -758,8 +1719,14 @@ class OARTool:
 
 
 def main():
+    if "--build-bundle" in sys.argv[1:]:
+        script_files_dir = Path(__file__).parent / "Script Files"
+        bundle_path = SaveFileManager(script_files_dir).build_bundle()
+        print(f"Template bundle written: {bundle_path }")
+        return
+
     try:
-        app = OARTool()
+        app = OARTool(dry_run="--dry-run" in sys.argv[1:])
         app.run()
     except Exception as e:
         logging.critical(f"Application failed to start: {e }", exc_info=True)
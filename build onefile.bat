@@ -1 +1,2 @@
-python -m nuitka "%~dp0OAR_tool.py" --onefile --enable-plugin=tk-inter --include-data-dir="%~dp0Script Files"="Script Files" --windows-icon-from-ico="%~dp0Script Files\custom_icon.ico" --windows-console-mode=disable --windows-company-name="FireNinja7365" --windows-product-name="OAR Tool" --windows-file-version="3.4" --windows-product-version="3.4" --windows-file-description="OAR Tool"
+python "%~dp0OAR_tool.py" --build-bundle || exit /b 1
+python -m nuitka "%~dp0OAR_tool.py" --onefile --enable-plugin=tk-inter --include-data-files="%~dp0Script Files\templates.oarb"="Script Files/templates.oarb" --include-data-files="%~dp0Script Files\custom_icon.ico"="Script Files/custom_icon.ico" --windows-icon-from-ico="%~dp0Script Files\custom_icon.ico" --windows-console-mode=disable --windows-company-name="FireNinja7365" --windows-product-name="OAR Tool" --windows-file-version="3.4" --windows-product-version="3.4" --windows-file-description="OAR Tool"